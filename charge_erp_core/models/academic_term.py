@@ -10,5 +10,5 @@ class OpAcademicTerm(models.Model):
     term_start_date = fields.Date('Start Date', required=True)
     term_end_date = fields.Date('End Date', required=True)
     academic_year_id = fields.Many2one(
-        'op.academic.year', 'Academic Year', required=True)
+        'op.academic.year', 'Academic Year', required=True, index=True)
     parent_term = fields.Many2one('op.academic.term', 'Parent Term')
@@ -12,7 +12,7 @@ class OpBatch(models.Model):
     start_date = fields.Date(
         'Start Date', required=True, default=fields.Date.today())
     end_date = fields.Date('End Date', required=True)
-    course_id = fields.Many2one('op.course', 'Course', required=True)
+    course_id = fields.Many2one('op.course', 'Course', required=True, index=True)
     active = fields.Boolean(default=True)
 
     _sql_constraints = [
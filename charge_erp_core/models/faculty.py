@@ -25,13 +25,12 @@ class OpFaculty(models.Model):
     @api.depends('first_name', 'middle_name', 'last_name')
     def _compute_name(self):
         for record in self:
-            fname = record.first_name or ""
-            mname = record.middle_name or ""
-            lname = record.last_name or ""
-            record.name = " ".join(filter(None, [fname, mname, lname]))
+            record.name = " ".join(filter(None, [
+                record.first_name, record.middle_name, record.last_name]))
 
     @api.constrains('birth_date')
     def _check_birthdate(self):
+        today = fields.Date.today()
         for record in self:
-            if record.birth_date and record.birth_date > fields.Date.today():
+            if record.birth_date and record.birth_date > today:
                 raise ValidationError(_("Birth Date can't be greater than current date!"))